@@ -1,11 +1,16 @@
 import os
 import requests
+from requests.adapters import HTTPAdapter
 import argparse
-import json 
+import ijson
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from plexapi import utils
 from plexapi.server import PlexServer
 import urllib3
 from urllib3.exceptions import InsecureRequestWarning
+from urllib3.util.retry import Retry
 
 # Suppress the InsecureRequestWarning
 urllib3.disable_warnings(InsecureRequestWarning)
@@ -18,44 +23,48 @@ PLEX_TOKEN = os.environ.get("PLEX_TOKEN")
 # Define the tags that will exclude movies from deletion/processing
 EXCLUDE_TAG_NAMES = ["keep", "donotdelete"]
 # This will store the numerical IDs of these tags after fetching from Radarr
-EXCLUDE_TAG_IDS = [] 
-
-# --- Authentication Check Function ---
-def check_radarr_api_auth():
-    """
-    Performs a basic authentication check against the Radarr API.
-    Attempts to get system status.
+EXCLUDE_TAG_IDS = frozenset() 
+# TMDb IDs already on Radarr's exclusion list, fetched once so known exclusions aren't re-posted
+EXCLUDED_TMDB_IDS = set()
+
+# Number of items per page when listing a Plex library section, and how many pages are fetched concurrently
+PLEX_PAGE_SIZE = 100
+PLEX_MAX_WORKERS = 8
+# Movie attributes requested from Plex when listing the library section
+PLEX_INCLUDE_FIELDS = "title,year"
+
+# Number of movies deleted/excluded in Radarr concurrently
+RADARR_MAX_WORKERS = 8
+
+# Shared session so all Radarr calls reuse pooled connections and retry transient errors with back-off
+radarr_session = requests.Session()
+radarr_session.headers.update({"X-Api-Key": RADARR_API_KEY})
+radarr_session.verify = False
+_radarr_adapter = HTTPAdapter(
+    pool_maxsize=32,
+    max_retries=Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504], raise_on_status=False)
+)
+radarr_session.mount("http://", _radarr_adapter)
+radarr_session.mount("https://", _radarr_adapter)
+
+# --- Authentication Error Handling ---
+def raise_for_radarr(response):
     """
-    if not RADARR_URL or not RADARR_API_KEY:
-        print("Error: Radarr URL or API Key not found in environment variables. Cannot perform auth check.")
-        return False
+    Raises for bad Radarr API responses, exiting with guidance if the API key was rejected.
+    Used instead of a dedicated authentication check, so the first real request doubles as one.
 
-    headers = {"X-Api-Key": RADARR_API_KEY}
-    test_url = f"{RADARR_URL}/api/v3/system/status"
-
-    print(f"\n--- Performing Radarr API Authentication Check ({test_url})... ---")
-    try:
-        response = requests.get(test_url, headers=headers, verify=False, timeout=10)
-        response.raise_for_status() # Raise HTTPError for bad responses (4xx or 5xx)
-        print("Radarr API authentication successful!")
-        return True
-    except requests.exceptions.HTTPError as e:
-        if e.response.status_code == 401:
-            print(f"Radarr API Authentication Failed: 401 Unauthorized. Please check your RADARR_API_KEY.")
-        elif e.response.status_code == 403:
-            print(f"Radarr API Authentication Failed: 403 Forbidden. Please check your API key permissions.")
-        else:
-            print(f"Radarr API Authentication Failed: HTTP Error {e.response.status_code}. Response: {e.response.text}")
-        return False
-    except requests.exceptions.ConnectionError as e:
-        print(f"Radarr API Connection Error: Could not connect to {RADARR_URL}. Is Radarr running and URL correct? Error: {e}")
-        return False
-    except requests.exceptions.Timeout:
-        print(f"Radarr API Connection Timeout: Request to {RADARR_URL} timed out.")
-        return False
-    except Exception as e:
-        print(f"An unexpected error occurred during Radarr API authentication check: {e}")
-        return False
+    Args:
+        response (requests.Response): The response to check.
+    """
+    if response.status_code == 401:
+        print(f"Radarr API Authentication Failed: 401 Unauthorized. Please check your RADARR_API_KEY.")
+        print("\nExiting script due to Radarr API authentication failure.")
+        exit(1) # Exit with an error code
+    if response.status_code == 403:
+        print(f"Radarr API Authentication Failed: 403 Forbidden. Please check your API key permissions.")
+        print("\nExiting script due to Radarr API authentication failure.")
+        exit(1)
+    response.raise_for_status() # Raise HTTPError for other bad responses (4xx or 5xx)
 
 # --- Helper Function for Tags ---
 def get_radarr_tag_ids(tag_names):
@@ -67,26 +76,27 @@ def get_radarr_tag_ids(tag_names):
 
     Returns:
         dict: A dictionary mapping tag names to their IDs, e.g., {'keep': 1, 'donotdelete': 5}.
-              Returns an empty dict if tags cannot be fetched or found.
+              Returns an empty dict if none of the tags exist, or None if the tags cannot be fetched.
     """
     if not RADARR_URL or not RADARR_API_KEY:
         print("Error: Radarr URL or API Key not found. Cannot fetch tag IDs.")
-        return {}
+        return None
 
-    headers = {"X-Api-Key": RADARR_API_KEY}
     url = f"{RADARR_URL}/api/v3/tag"
     tag_map = {}
 
     print(f"--- Fetching Radarr tag IDs... ---")
     try:
-        response = requests.get(url, headers=headers, verify=False, timeout=10)
-        response.raise_for_status()
-        tags_data = response.json()
+        response = radarr_session.get(url, timeout=10)
+        raise_for_radarr(response)
+        tags_data = orjson.loads(response.content)
 
+        wanted_labels = {name.lower() for name in tag_names}
         for tag in tags_data:
             if tag.get("label") and tag.get("id"):
-                if tag["label"].lower() in [name.lower() for name in tag_names]:
-                    tag_map[tag["label"].lower()] = tag["id"]
+                label = tag["label"].lower()
+                if label in wanted_labels:
+                    tag_map[label] = tag["id"]
         
         if tag_map:
             print(f"Found IDs for requested tags: {tag_map}")
@@ -97,14 +107,40 @@ def get_radarr_tag_ids(tag_names):
 
     except requests.exceptions.RequestException as e:
         print(f"Error fetching Radarr tags from {url}: {e}")
-        return {}
+        return None
     except Exception as e:
         print(f"An unexpected error occurred while fetching Radarr tags: {e}")
-        return {}
+        return None
 
 
 # --- Plex Functions ---
 
+def _fetch_plex_elements_paged(plex, ekey, tag):
+    """
+    Fetches all items of a Plex container in pages of PLEX_PAGE_SIZE.
+    The first page reports the total size, after which the remaining pages are fetched concurrently.
+    Items are returned as raw XML elements; building plexapi objects for every item is comparatively slow.
+
+    Args:
+        plex (PlexServer): The connected Plex server.
+        ekey (str): The container endpoint, e.g. '/library/sections/1/all'.
+        tag (str): The XML tag of the items, e.g. 'Video' for movies.
+
+    Returns:
+        list: The XML elements of all pages, in server order.
+    """
+    def fetch_page(offset):
+        headers = {'X-Plex-Container-Start': str(offset), 'X-Plex-Container-Size': str(PLEX_PAGE_SIZE)}
+        return plex.query(ekey, headers=headers)
+
+    first_page = fetch_page(0)
+    total_size = utils.cast(int, first_page.attrib.get('totalSize', 0))
+
+    with ThreadPoolExecutor(max_workers=PLEX_MAX_WORKERS) as executor:
+        pages = [first_page] + list(executor.map(fetch_page, range(PLEX_PAGE_SIZE, total_size, PLEX_PAGE_SIZE)))
+
+    return [elem for page in pages for elem in page.findall(tag)]
+
 def get_watched_movies_older_than(days_ago):
     """
     Connects to Plex and lists movies watched longer than the specified number of days ago.
@@ -124,32 +160,32 @@ def get_watched_movies_older_than(days_ago):
         plex = PlexServer(PLEX_URL, PLEX_TOKEN)
         
         # Make sure 'Films' is the EXACT name of your movie library section in Plex.
-        movies = plex.library.section('Films').search(unwatched=False) 
+        movies_section = plex.library.section('Films')
+        threshold_ts = int((datetime.now() - timedelta(days=days_ago)).timestamp())
+        # The 'lastViewedAt<<' filter ('watched before') is applied by Plex, so only qualifying movies are returned.
+        # includeGuids=1 puts the GUIDs in the listing itself, so no extra request per movie is needed to read them,
+        # and includeFields limits each movie to the attributes used here.
+        movies = _fetch_plex_elements_paged(plex, f'/library/sections/{movies_section.key}/all?type=1&unwatched=0&includeGuids=1'
+                                                  f'&includeFields={PLEX_INCLUDE_FIELDS}&lastViewedAt%3C%3C={threshold_ts}', 'Video')
         
         watched_movies_data = []
-        threshold_date = datetime.now() - timedelta(days=days_ago)
 
         for movie in movies:
-            if hasattr(movie, 'lastViewedAt') and movie.lastViewedAt and movie.lastViewedAt < threshold_date:
-                plex_tmdb_id = None
-                # Iterate through GUIDs to find the TMDb ID
-                if hasattr(movie, 'guids') and movie.guids:
-                    for guid in movie.guids:
-                        if guid.id.startswith('tmdb://'):
-                            plex_tmdb_id = guid.id.split('//')[1]
-                            break
-                
-                # Get the year from Plex movie object
-                plex_movie_year = movie.year if hasattr(movie, 'year') and movie.year else 0 # Default to 0 if not found
-
-                if plex_tmdb_id and plex_movie_year > 0: # Ensure we have valid TMDb ID and Year
-                    watched_movies_data.append({
-                        'title': movie.title,
-                        'tmdb_id': plex_tmdb_id,
-                        'year': plex_movie_year
-                    })
-                else:
-                    print(f"  Warning: Skipping '{movie.title}' from Plex (TMDb ID: {plex_tmdb_id}, Year: {plex_movie_year}). Missing valid TMDb ID or Year for Radarr matching/exclusion.")
+            title = movie.attrib.get('title')
+            # Find the TMDb ID among the movie's <Guid id="tmdb://..."/> children
+            plex_tmdb_id = next((guid.attrib['id'].split('//', 1)[1] for guid in movie.findall('Guid') if guid.attrib.get('id', '').startswith('tmdb://')), None)
+            
+            # Get the year from the Plex movie element
+            plex_movie_year = utils.cast(int, movie.attrib.get('year')) or 0 # Default to 0 if not found
+
+            if plex_tmdb_id and plex_movie_year > 0: # Ensure we have valid TMDb ID and Year
+                watched_movies_data.append({
+                    'title': title,
+                    'tmdb_id': plex_tmdb_id,
+                    'year': plex_movie_year
+                })
+            else:
+                print(f"  Warning: Skipping '{title}' from Plex (TMDb ID: {plex_tmdb_id}, Year: {plex_movie_year}). Missing valid TMDb ID or Year for Radarr matching/exclusion.")
         
         return watched_movies_data
 
@@ -159,54 +195,61 @@ def get_watched_movies_older_than(days_ago):
 
 # --- Radarr Functions ---
 
-def get_radarr_movie_details_for_processing(plex_movie_data):
+def get_radarr_movies_by_tmdb_id():
     """
-    Searches Radarr for a movie by its TMDb ID and returns its Radarr ID, TMDb ID, title, and tags.
-    
-    Args:
-        plex_movie_data (dict): A dictionary containing 'title', 'tmdb_id', and 'year' from Plex.
+    Streams the full Radarr movie list into a slim TMDb ID index.
+    Movies are parsed one at a time straight off the response stream and only the fields
+    needed for matching are kept, so neither the raw body nor the full movie objects are
+    held in memory (this matters for large libraries on low-memory machines).
 
     Returns:
-        tuple: (Radarr ID (int), TMDb ID (int), Radarr Title (str), Radarr Tags (list of int)) if found, otherwise (None, None, None, None).
+        dict: A dictionary mapping TMDb IDs (str) to (Radarr ID (int), TMDb ID (int), Radarr Title (str), Radarr Tags (list of int)),
+              or None if the list could not be fetched.
     """
-    plex_title = plex_movie_data['title']
-    plex_tmdb_id = plex_movie_data['tmdb_id']
-
     if not RADARR_URL or not RADARR_API_KEY:
         print("Error: Radarr URL or API Key not found in environment variables.")
-        return None, None, None, None
-    if not plex_tmdb_id:
-        print(f"  Error: Cannot search Radarr for '{plex_title}', TMDb ID is missing.")
-        return None, None, None, None
+        return None
 
-    headers = {"X-Api-Key": RADARR_API_KEY}
     url = f"{RADARR_URL}/api/v3/movie" # Endpoint to get all movies
-    
+
+    print(f"--- Fetching Radarr movie list... ---")
     try:
-        response = requests.get(url, headers=headers, verify=False)
-        response.raise_for_status()
-        movies = response.json()
+        with radarr_session.get(url, stream=True) as response:
+            raise_for_radarr(response)
+            response.raw.decode_content = True # Let urllib3 undo any gzip encoding before ijson reads the stream
+            movies = ijson.items(response.raw, "item")
+            return {str(m["tmdbId"]): (m["id"], m["tmdbId"], m.get("title"), m.get("tags", [])) for m in movies if m.get("tmdbId")}
+    except requests.exceptions.RequestException as e:
+        print(f"Error fetching Radarr movie list from {url}: {e}")
+        return None
+    except Exception as e:
+        print(f"An unexpected error occurred while fetching the Radarr movie list: {e}")
+        return None
 
-        for movie in movies:
-            # Match primarily by TMDb ID
-            if movie.get("tmdbId") and str(movie["tmdbId"]) == str(plex_tmdb_id):
-                radarr_id = movie["id"]
-                tmdb_id = movie["tmdbId"] # This is Radarr's TMDb ID, should match Plex's
-                radarr_title = movie.get("title")
-                radarr_tags = movie.get("tags", []) # Get the list of tag IDs
-                
-                print(f"  - Matched '{plex_title}' (Plex TMDb: {plex_tmdb_id}) with Radarr ID {radarr_id} ('{radarr_title}', Radarr TMDb: {tmdb_id}). Tags: {radarr_tags}")
-                return radarr_id, tmdb_id, radarr_title, radarr_tags
-        
-        print(f"  - No matching movie found in Radarr for '{plex_title}' (Plex TMDb ID: {plex_tmdb_id})")
-        return None, None, None, None
+def get_radarr_excluded_tmdb_ids():
+    """
+    Fetches the TMDb IDs of all movies already on Radarr's general exclusion list.
 
+    Returns:
+        set: The excluded TMDb IDs (int). Returns an empty set if the list cannot be fetched.
+    """
+    if not RADARR_URL or not RADARR_API_KEY:
+        print("Error: Radarr URL or API Key not found in environment variables.")
+        return set()
+
+    url = f"{RADARR_URL}/api/v3/exclusions"
+
+    print(f"--- Fetching Radarr exclusion list... ---")
+    try:
+        response = radarr_session.get(url, timeout=10)
+        response.raise_for_status() # Failing here only means known exclusions may be re-posted, so don't exit mid-processing
+        return {exclusion["tmdbId"] for exclusion in orjson.loads(response.content) if exclusion.get("tmdbId")}
     except requests.exceptions.RequestException as e:
-        print(f"Error communicating with Radarr API for '{plex_title}': {e}")
-        return None, None, None, None
+        print(f"Error fetching Radarr exclusion list from {url}: {e}")
+        return set()
     except Exception as e:
-        print(f"An unexpected error occurred while searching Radarr for '{plex_title}': {e}")
-        return None, None, None, None
+        print(f"An unexpected error occurred while fetching the Radarr exclusion list: {e}")
+        return set()
 
 def delete_radarr_movie_and_files(radarr_movie_id):
     """
@@ -222,13 +265,12 @@ def delete_radarr_movie_and_files(radarr_movie_id):
         print("Error: Radarr URL or API Key not found in environment variables.")
         return False
 
-    headers = {"X-Api-Key": RADARR_API_KEY}
     url = f"{RADARR_URL}/api/v3/movie/{radarr_movie_id}"
     params = {"deleteFiles": "true"} # Parameter to also delete files from disk
     
     try:
         print(f"  - Attempting to delete Radarr movie ID {radarr_movie_id} (and files)...")
-        response = requests.delete(url, headers=headers, params=params, verify=False)
+        response = radarr_session.delete(url, params=params)
         response.raise_for_status()
         print(f"  - Successfully deleted Radarr movie ID {radarr_movie_id} and its files.")
         return True
@@ -240,6 +282,43 @@ def delete_radarr_movie_and_files(radarr_movie_id):
         print(f"An unexpected error occurred while deleting Radarr movie ID {radarr_movie_id}: {e}")
         return False
 
+def delete_radarr_movies_bulk(radarr_movie_ids):
+    """
+    Deletes several movies from Radarr with a single request, including their files,
+    and adds them to the exclusion list. This uses the DELETE /api/v3/movie/editor endpoint.
+    
+    Args:
+        radarr_movie_ids (list): The IDs of the movies in Radarr.
+
+    Returns:
+        bool: True if the movies were deleted and excluded, False otherwise.
+    """
+    if not RADARR_URL or not RADARR_API_KEY:
+        print("Error: Radarr URL or API Key not found in environment variables.")
+        return False
+
+    url = f"{RADARR_URL}/api/v3/movie/editor"
+
+    payload = {
+        "movieIds": radarr_movie_ids,
+        "deleteFiles": True, # Also delete files from disk
+        "addImportExclusion": True
+    }
+
+    try:
+        print(f"  - Attempting to delete {len(radarr_movie_ids)} Radarr movies (and files) and add them to the exclusion list...")
+        response = radarr_session.delete(url, json=payload)
+        response.raise_for_status()
+        print(f"  - Successfully deleted {len(radarr_movie_ids)} Radarr movies and their files.")
+        return True
+
+    except requests.exceptions.RequestException as e:
+        print(f"Error deleting Radarr movies via the movie editor: {e}")
+        return False
+    except Exception as e:
+        print(f"An unexpected error occurred while deleting Radarr movies via the movie editor: {e}")
+        return False
+
 def add_to_radarr_exclusion_list(tmdb_id, movie_title, movie_year):
     """
     Adds a movie to Radarr's general exclusion list using its TMDb ID, title, and year.
@@ -259,8 +338,10 @@ def add_to_radarr_exclusion_list(tmdb_id, movie_title, movie_year):
     if not tmdb_id or not movie_title or not movie_year or movie_year <= 0:
         print(f"  Error: Cannot add to exclusion list. Missing/invalid TMDb ID ({tmdb_id}), Title ('{movie_title}'), or Year ({movie_year}).")
         return False
+    if int(tmdb_id) in EXCLUDED_TMDB_IDS:
+        print(f"  Note: '{movie_title}' is already in the exclusion list.")
+        return True
 
-    headers = {"X-Api-Key": RADARR_API_KEY, "Content-Type": "application/json"}
     url = f"{RADARR_URL}/api/v3/exclusions" 
     
     payload = {
@@ -273,20 +354,22 @@ def add_to_radarr_exclusion_list(tmdb_id, movie_title, movie_year):
 
     try:
         print(f"  - Attempting to add '{movie_title}' (TMDb ID: {tmdb_id}, Year: {movie_year}) to Radarr exclusion list...")
-        response = requests.post(url, headers=headers, data=json.dumps(payload), verify=False)
+        response = radarr_session.post(url, json=payload)
         response.raise_for_status() 
         print(f"  - Successfully added '{movie_title}' to Radarr exclusion list.")
+        EXCLUDED_TMDB_IDS.add(int(tmdb_id))
         return True
     except requests.exceptions.HTTPError as e: 
         print(f"Error adding '{movie_title}' to Radarr exclusion list: {e}")
         if response.status_code == 400:
             print(f"  Radarr API responded with 400 Bad Request. Response body: {response.text}")
             try:
-                error_details = response.json()
+                error_details = orjson.loads(response.content)
                 if any(err.get("errorCode") == "ImportListExclusionExistsValidator" for err in error_details):
                     print(f"  Note: '{movie_title}' might already be in the exclusion list (via API response).")
+                    EXCLUDED_TMDB_IDS.add(int(tmdb_id))
                     return True 
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 pass 
         return False 
     except requests.exceptions.RequestException as e:
@@ -296,24 +379,65 @@ def add_to_radarr_exclusion_list(tmdb_id, movie_title, movie_year):
         print(f"An unexpected error occurred while adding '{movie_title}' to exclusion list: {e}")
         return False
 
+def add_to_radarr_exclusion_list_bulk(movies):
+    """
+    Adds several movies to Radarr's general exclusion list with a single request.
+    This uses the POST /api/v3/exclusions/bulk endpoint and falls back to one request per movie
+    on Radarr versions without it, or when Radarr rejects the batch (e.g. because a movie is already excluded).
+    
+    Args:
+        movies (list): A list of (TMDb ID, title, year) tuples.
 
-# --- Main Script Logic ---
+    Returns:
+        set: The TMDb IDs that are on the exclusion list afterwards.
+    """
+    # Movies that are known to be excluded already don't need to be sent again
+    already_excluded = {tmdb_id for tmdb_id, _, _ in movies if int(tmdb_id) in EXCLUDED_TMDB_IDS}
+    movies = [movie for movie in movies if movie[0] not in already_excluded]
+    if already_excluded:
+        print(f"  Note: {len(already_excluded)} movies are already in the exclusion list.")
+    if not movies:
+        return already_excluded
+    if not RADARR_URL or not RADARR_API_KEY:
+        print("Error: Radarr URL or API Key not found in environment variables.")
+        return already_excluded
 
-if __name__ == "__main__":
-    # --- Perform Radarr API Authentication Check ---
-    if not check_radarr_api_auth():
-        print("\nExiting script due to Radarr API authentication failure.")
-        exit(1) # Exit with an error code
+    url = f"{RADARR_URL}/api/v3/exclusions/bulk"
 
-    # --- Fetch Radarr Tag IDs for exclusion ---
-    tag_ids_map = get_radarr_tag_ids(EXCLUDE_TAG_NAMES)
-    for tag_name in EXCLUDE_TAG_NAMES:
-        if tag_name.lower() not in tag_ids_map:
-            print(f"Warning: Radarr tag '{tag_name}' not found. Movies with this tag will NOT be excluded from processing.")
-    # Store the actual IDs we found globally for easy checking
-    EXCLUDE_TAG_IDS = list(tag_ids_map.values())
+    payload = [
+        {
+            "tmdbId": int(tmdb_id),
+            "movieTitle": movie_title,
+            "movieYear": int(movie_year),
+            "foreignId": str(tmdb_id),
+            "foreignIdType": "tmdbId"
+        }
+        for tmdb_id, movie_title, movie_year in movies
+    ]
+
+    try:
+        print(f"  - Attempting to add {len(movies)} movies to Radarr exclusion list...")
+        response = radarr_session.post(url, json=payload)
+        if response.status_code not in (400, 404, 405):
+            response.raise_for_status()
+            print(f"  - Successfully added {len(movies)} movies to Radarr exclusion list.")
+            EXCLUDED_TMDB_IDS.update(int(tmdb_id) for tmdb_id, _, _ in movies)
+            return already_excluded | {tmdb_id for tmdb_id, _, _ in movies}
+        print(f"  Radarr API responded with {response.status_code} to the bulk exclusion request. Adding movies one by one.")
+    except requests.exceptions.RequestException as e:
+        print(f"Error adding movies to Radarr exclusion list: {e}")
+        return already_excluded
+    except Exception as e:
+        print(f"An unexpected error occurred while adding movies to exclusion list: {e}")
+        return already_excluded
 
+    # Per-movie requests tolerate movies that are already excluded
+    return already_excluded | {tmdb_id for tmdb_id, movie_title, movie_year in movies if add_to_radarr_exclusion_list(tmdb_id, movie_title, movie_year)}
 
+
+# --- Main Script Logic ---
+
+if __name__ == "__main__":
     parser = argparse.ArgumentParser(
         description="Lists watched movies from Plex, then optionally deletes them from Radarr (including files) and adds them to the general exclusion list to prevent re-imports."
     )
@@ -336,11 +460,34 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
+    # Tag IDs for exclusion (this also surfaces authentication failures before anything else is started)
+    tag_ids_map = get_radarr_tag_ids(EXCLUDE_TAG_NAMES)
+    if tag_ids_map is None:
+        if args.process_radarr:
+            # Without the tag IDs, protected movies can't be told apart from the rest
+            print("\nExiting script because the Radarr tags could not be fetched.")
+            exit(1)
+        tag_ids_map = {}
+    for tag_name in EXCLUDE_TAG_NAMES:
+        if tag_name.lower() not in tag_ids_map:
+            print(f"Warning: Radarr tag '{tag_name}' not found. Movies with this tag will NOT be excluded from processing.")
+    # Store the actual IDs we found globally for easy checking
+    EXCLUDE_TAG_IDS = frozenset(tag_ids_map.values())
+    id_to_label = {_id: name for name, _id in tag_ids_map.items()}
+
     days_threshold = args.days
-    
-    print(f"\nSearching for movies watched longer than {days_threshold} days ago in Plex...")
-    
-    plex_watched_movies_data = get_watched_movies_older_than(days_threshold) # Now returns list of dicts
+
+    # --- Only the Radarr movie list GET runs in the background, concurrently with the Plex scan ---
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # The movie list is only needed for matching, so it keeps downloading while Plex is being scanned
+        radarr_movies_future = executor.submit(get_radarr_movies_by_tmdb_id) if args.process_radarr else None
+
+        print(f"\nSearching for movies watched longer than {days_threshold} days ago in Plex...")
+        
+        plex_watched_movies_data = get_watched_movies_older_than(days_threshold) # Now returns list of dicts
+
+        # Always collected, so an authentication exit raised in the download thread stops the script here
+        radarr_matches = radarr_movies_future.result() if radarr_movies_future else None
 
     if not plex_watched_movies_data:
         print(f"No movies found that were watched longer than {days_threshold} days ago, or an error occurred with Plex.")
@@ -352,25 +499,41 @@ if __name__ == "__main__":
 
         if args.process_radarr:
             print(f"\n--- Preparing for Radarr Processing ---")
-            # Store {Plex Title: (Radarr ID, TMDb ID, Radarr Title, Movie Year from Plex, Radarr Tags)}
+            # Store {Plex Title: (Radarr ID, TMDb ID, Radarr Title, Movie Year from Plex)}
             movies_to_process_radarr = {} 
 
+            # Match against the Radarr library indexed alongside the Plex scan
+            wanted = {str(plex_movie_data['tmdb_id']): plex_movie_data for plex_movie_data in plex_watched_movies_data}
+            if radarr_matches is None:
+                print("\nExiting script because the Radarr movie list could not be loaded.")
+                exit(1)
+
             print("Matching Plex watched movies with Radarr entries by TMDb ID:")
-            for plex_movie_data in plex_watched_movies_data:
-                radarr_id, tmdb_id, radarr_title, radarr_tags = get_radarr_movie_details_for_processing(plex_movie_data)
-                
-                if radarr_id: 
-                    # Use Radarr's title if found, otherwise fall back to Plex's. 
-                    # Pass the year from plex_movie_data
-                    movies_to_process_radarr[plex_movie_data['title']] = (radarr_id, tmdb_id, radarr_title or plex_movie_data['title'], plex_movie_data['year'], radarr_tags)
+            for plex_tmdb_id, plex_movie_data in wanted.items():
+                if plex_tmdb_id not in radarr_matches:
+                    print(f"  - No matching movie found in Radarr for '{plex_movie_data['title']}' (Plex TMDb ID: {plex_tmdb_id})")
+                    continue
+
+                # tmdb_id is Radarr's TMDb ID, should match Plex's
+                radarr_id, tmdb_id, radarr_title, radarr_tags = radarr_matches[plex_tmdb_id]
+                print(f"  - Matched '{plex_movie_data['title']}' (Plex TMDb: {plex_tmdb_id}) with Radarr ID {radarr_id} ('{radarr_title}', Radarr TMDb: {tmdb_id}). Tags: {radarr_tags}")
+
+                # Check for exclusion tags before the movie is ever considered for processing
+                if EXCLUDE_TAG_IDS.intersection(radarr_tags):
+                    tag_labels = [id_to_label[tag_id] for tag_id in radarr_tags if tag_id in id_to_label]
+                    print(f"  Skipping '{plex_movie_data['title']}' (Radarr ID: {radarr_id}) because it has the tag(s) {tag_labels}.")
+                    continue
+
+                # Use Radarr's title if found, otherwise fall back to Plex's. 
+                # Pass the year from plex_movie_data
+                movies_to_process_radarr[plex_movie_data['title']] = (radarr_id, tmdb_id, radarr_title or plex_movie_data['title'], plex_movie_data['year'])
             
             if not movies_to_process_radarr:
                 print("No matching movies found in Radarr for processing.")
             else:
                 print(f"\nFound {len(movies_to_process_radarr)} matching movies in Radarr for processing:")
-                for title, (radarr_id, tmdb_id, radarr_title_for_exclusion, movie_year_for_exclusion, radarr_tags) in movies_to_process_radarr.items():
-                    tag_labels = [name for name, _id in tag_ids_map.items() if _id in radarr_tags]
-                    print(f"- '{title}' (Radarr ID: {radarr_id}, TMDb ID: {tmdb_id if tmdb_id else 'N/A'}, Year: {movie_year_for_exclusion}, Tags: {tag_labels if tag_labels else 'None'})")
+                for title, (radarr_id, tmdb_id, radarr_title_for_exclusion, movie_year_for_exclusion) in movies_to_process_radarr.items():
+                    print(f"- '{title}' (Radarr ID: {radarr_id}, TMDb ID: {tmdb_id if tmdb_id else 'N/A'}, Year: {movie_year_for_exclusion})")
 
                 if not args.no_prompt:
                     confirmation = input("\nAre you sure you want to delete these movies from Radarr (including files) and add them to the general exclusion list? This will remove them from Radarr's database. (type 'yes' to confirm): ").strip().lower()
@@ -381,36 +544,42 @@ if __name__ == "__main__":
                     print("\n--no-prompt flag detected. Proceeding with processing without confirmation.")
 
                 print("\n--- Processing Movies in Radarr ---")
-                for title, (radarr_id, tmdb_id, radarr_title_for_exclusion, movie_year_for_exclusion, radarr_tags) in movies_to_process_radarr.items():
-                    # Check for exclusion tags
-                    should_skip_due_to_tag = False
-                    for exclude_tag_id in EXCLUDE_TAG_IDS:
-                        if exclude_tag_id in radarr_tags:
-                            tag_label = next((name for name, _id in tag_ids_map.items() if _id == exclude_tag_id), str(exclude_tag_id))
-                            print(f"  Skipping '{title}' (Radarr ID: {radarr_id}) because it has the tag '{tag_label}'.")
-                            should_skip_due_to_tag = True
-                            break
-                    
-                    if should_skip_due_to_tag:
-                        continue # Skip to the next movie in the loop
-
-                    print(f"Processing '{title}' (Radarr ID: {radarr_id})...")
-                    
-                    delete_success = delete_radarr_movie_and_files(radarr_id)
-                    exclusion_success = False
-
-                    # Only add to exclusion if deletion was attempted and we have valid TMDb ID and Year
-                    if delete_success and tmdb_id and movie_year_for_exclusion and movie_year_for_exclusion > 0: 
-                        exclusion_success = add_to_radarr_exclusion_list(tmdb_id, radarr_title_for_exclusion, movie_year_for_exclusion)
-                    elif not tmdb_id:
-                        print(f"  Skipping exclusion for '{title}' as TMDb ID is missing.")
-                    elif not movie_year_for_exclusion or movie_year_for_exclusion <= 0:
-                        print(f"  Skipping exclusion for '{title}' as Movie Year is missing or invalid.")
-
-                    if delete_success and (exclusion_success or not tmdb_id or not movie_year_for_exclusion or movie_year_for_exclusion <= 0):
+                movies_to_delete = [(title, *movie) for title, movie in movies_to_process_radarr.items()]
+
+                # Delete and exclude all movies with a single movie editor request
+                if delete_radarr_movies_bulk([movie[1] for movie in movies_to_delete]):
+                    for title, *_ in movies_to_delete:
                         print(f"  Successfully processed '{title}'.")
-                    else:
-                        print(f"  Finished processing '{title}' with some issues (Deleted: {delete_success}, Excluded from list: {exclusion_success}).")
+                else:
+                    print("  Falling back to deleting movies one by one.")
+                    # Deletions are independent of each other, so run them concurrently
+                    with ThreadPoolExecutor(max_workers=RADARR_MAX_WORKERS) as executor:
+                        delete_results = list(executor.map(delete_radarr_movie_and_files, [movie[1] for movie in movies_to_delete]))
+
+                    # Only add to exclusion if deletion succeeded and we have valid TMDb ID and Year
+                    movies_to_exclude = []
+                    for (title, radarr_id, tmdb_id, radarr_title_for_exclusion, movie_year_for_exclusion), delete_success in zip(movies_to_delete, delete_results):
+                        if not delete_success:
+                            continue
+                        if not tmdb_id:
+                            print(f"  Skipping exclusion for '{title}' as TMDb ID is missing.")
+                        elif not movie_year_for_exclusion or movie_year_for_exclusion <= 0:
+                            print(f"  Skipping exclusion for '{title}' as Movie Year is missing or invalid.")
+                        else:
+                            movies_to_exclude.append((tmdb_id, radarr_title_for_exclusion, movie_year_for_exclusion))
+
+                    # Existing exclusions, so movies already excluded are not re-posted
+                    if movies_to_exclude:
+                        EXCLUDED_TMDB_IDS.update(get_radarr_excluded_tmdb_ids())
+                    excluded_tmdb_ids = add_to_radarr_exclusion_list_bulk(movies_to_exclude)
+
+                    for (title, radarr_id, tmdb_id, radarr_title_for_exclusion, movie_year_for_exclusion), delete_success in zip(movies_to_delete, delete_results):
+                        exclusion_success = tmdb_id in excluded_tmdb_ids
+                        if delete_success and (exclusion_success or not tmdb_id or not movie_year_for_exclusion or movie_year_for_exclusion <= 0):
+                            print(f"  Successfully processed '{title}'.")
+                        else:
+                            print(f"  Finished processing '{title}' with some issues (Deleted: {delete_success}, Excluded from list: {exclusion_success}).")
+
                 print("-----------------------------------")
         else:
             print("\nRadarr processing is disabled. Use --process-radarr flag to enable.")